@@ -6,8 +6,11 @@
 # ruff: noqa: D400
 # ruff: noqa: E501
 
+import asyncio
+import functools
 import json
 import logging
+import os
 import random
 import time
 from dataclasses import dataclass
@@ -20,11 +23,16 @@ from typing import Any
 import aiohttp
 import requests
 from eth_account import Account
+from requests.adapters import HTTPAdapter, Retry
 from eth_account.messages import encode_typed_data, SignableMessage
 
-from .grvt_ccxt_env import CHAIN_IDS, GrvtEnv
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from .grvt_ccxt_env import CHAIN_IDS, GrvtEnv, get_grvt_endpoint
 from .grvt_ccxt_types import (
-    BTC_ETH_SIZE_MULTIPLIER,
     DURATION_SECOND_IN_NSEC,
     Amount,
     GrvtOrderSide,
@@ -70,6 +78,12 @@ TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE = {
     TimeInForce.FILL_OR_KILL: SignTimeInForce.FILL_OR_KILL,
 }
 
+# Flattened TimeInForce -> int mapping for the signing hot path: one dict
+# lookup instead of an Enum lookup chain plus a .value attribute access.
+_TIF_TO_SIGN_TIF_VALUE = {
+    tif: sign_tif.value for tif, sign_tif in TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE.items()
+}
+
 
 def get_EIP712_domain_data(env: GrvtEnv) -> dict[str, str | int]:
     # DO NOT MODIFY THESE VALUES ##############
@@ -165,6 +179,173 @@ async def get_cookie_with_expiration_async(
         return None
 
 
+# Shared session for instrument fetches: keeps the TCP+TLS connection alive
+# across calls (and envs), so only the first fetch pays the TLS handshake.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=2, backoff_factor=0.2)),
+)
+_SESSION.headers.update({"Accept-Encoding": "gzip", "Connection": "keep-alive"})
+
+INSTRUMENTS_CACHE_TTL_SECS = 24 * 60 * 60
+_INSTRUMENTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "grvt")
+# In-process memo of (env, endpoint) -> (fetched_at, instruments) so that repeated
+# calls within one process return without touching the disk cache.
+_instruments_memo: dict[tuple[str, str], tuple[float, dict]] = {}
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parses JSON bytes, via orjson when available (~5-10x faster than stdlib)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serializes `obj` to JSON bytes, via orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode()
+
+
+def _instruments_cache_path(env: GrvtEnv) -> str:
+    return os.path.join(_INSTRUMENTS_CACHE_DIR, f"instruments_{env.value}.json")
+
+
+def _load_cached_instruments(
+    env: GrvtEnv, ttl: float = INSTRUMENTS_CACHE_TTL_SECS
+) -> dict | None:
+    """
+    Returns instruments from the on-disk cache if they are younger than `ttl` seconds.
+    Returns None on a cache miss (missing, stale or unreadable cache file).
+    """
+    path = _instruments_cache_path(env)
+    try:
+        if time.time() - os.path.getmtime(path) >= ttl:
+            return None
+        with open(path, "rb") as f:
+            cached: dict = _json_loads(f.read())
+        return cached.get("instruments")
+    except (OSError, ValueError):
+        return None
+
+
+def _save_cached_instruments(env: GrvtEnv, endpoint: str, instruments: dict) -> None:
+    """Writes instruments together with fetch metadata to the on-disk cache."""
+    path = _instruments_cache_path(env)
+    try:
+        os.makedirs(_INSTRUMENTS_CACHE_DIR, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(
+                _json_dumps(
+                    {
+                        "fetched_at": time.time(),
+                        "endpoint": endpoint,
+                        "env": env.value,
+                        "instruments": instruments,
+                    }
+                )
+            )
+    except OSError as e:
+        logging.warning(f"_save_cached_instruments: unable to write {path=} {e}")
+
+
+def fetch_instruments_from_api(
+    env: GrvtEnv, ttl: float = INSTRUMENTS_CACHE_TTL_SECS
+) -> dict[str, dict]:
+    """
+    Fetches all active instruments for `env`, keyed by instrument name.
+
+    Results are cached in-process and on disk (`~/.cache/grvt`) for `ttl` seconds
+    so repeated signing runs skip the HTTPS round-trip. Pass ttl=0 to force a refresh.
+    :return: dict of instrument dictionaries. See GrvtCcxt.fetch_markets() for keys.
+    """
+    FN = f"fetch_instruments_from_api {env=}"
+    endpoint = get_grvt_endpoint(env, "GET_ALL_INSTRUMENTS")
+    memo_key = (env.value, endpoint)
+    memoized = _instruments_memo.get(memo_key)
+    if memoized and time.time() - memoized[0] < ttl:
+        return memoized[1]
+    instruments: dict | None = _load_cached_instruments(env, ttl)
+    if instruments is None:
+        # stream=False buffers the (small) payload so response.content is the
+        # fully decompressed body, decoded in one _json_loads call.
+        response = _SESSION.post(
+            endpoint, json={"is_active": True}, timeout=30, stream=False
+        )
+        response.raise_for_status()
+        data: dict = _json_loads(response.content)
+        instruments = {
+            str(row["instrument"]): row
+            for row in data.get("result", ())
+            if row.get("instrument")
+        }
+        logging.info(f"{FN}: fetched {len(instruments)} instruments from {endpoint}")
+        _save_cached_instruments(env, endpoint, instruments)
+    _instruments_memo[memo_key] = (time.time(), instruments)
+    return instruments
+
+
+async def fetch_instruments_from_api_async(
+    env: GrvtEnv,
+    ttl: float = INSTRUMENTS_CACHE_TTL_SECS,
+    session: aiohttp.ClientSession | None = None,
+) -> dict[str, dict]:
+    """
+    Async variant of fetch_instruments_from_api.
+
+    Honors the same in-process memo and on-disk cache, so a cached env returns
+    without opening a socket. Pass `session` to share one aiohttp.ClientSession
+    across concurrent fetches.
+    :return: dict of instrument dictionaries. See GrvtCcxt.fetch_markets() for keys.
+    """
+    FN = f"fetch_instruments_from_api_async {env=}"
+    endpoint = get_grvt_endpoint(env, "GET_ALL_INSTRUMENTS")
+    memo_key = (env.value, endpoint)
+    memoized = _instruments_memo.get(memo_key)
+    if memoized and time.time() - memoized[0] < ttl:
+        return memoized[1]
+    instruments: dict | None = _load_cached_instruments(env, ttl)
+    if instruments is None:
+        own_session = session is None
+        if own_session:
+            session = aiohttp.ClientSession()
+        try:
+            async with session.post(
+                endpoint, json={"is_active": True}, timeout=30
+            ) as response:
+                response.raise_for_status()
+                data: dict = _json_loads(await response.read())
+        finally:
+            if own_session:
+                await session.close()
+        instruments = {
+            str(row["instrument"]): row
+            for row in data.get("result", ())
+            if row.get("instrument")
+        }
+        logging.info(f"{FN}: fetched {len(instruments)} instruments from {endpoint}")
+        _save_cached_instruments(env, endpoint, instruments)
+    _instruments_memo[memo_key] = (time.time(), instruments)
+    return instruments
+
+
+async def fetch_instruments_all_envs(
+    envs: list[GrvtEnv], ttl: float = INSTRUMENTS_CACHE_TTL_SECS
+) -> dict[str, dict[str, dict]]:
+    """
+    Fetches instruments for several envs concurrently via asyncio.gather,
+    so total latency is the max of the individual endpoints, not the sum.
+    :return: dict of env value -> instruments dict.
+    """
+    async with aiohttp.ClientSession() as session:
+        results = await asyncio.gather(
+            *(fetch_instruments_from_api_async(env, ttl, session) for env in envs)
+        )
+    return {env.value: instruments for env, instruments in zip(envs, results)}
+
+
 class GrvtKind(Enum):
     PERPETUAL = 1
     FUTURE = 2
@@ -223,6 +404,34 @@ def get_kuq_from_symbol(symbol: str) -> tuple[str, str, str]:
     return kind, underlying, quote
 
 
+# Precomputed powers of ten so the per-leg size multiplier is a tuple index
+# instead of an integer pow on every sign.
+_POW10 = tuple(10**i for i in range(40))
+# Decimal counterparts, built once: Decimal construction from int is not free
+# and the multipliers never change.
+_DEC_POW10 = tuple(Decimal(p) for p in _POW10)
+
+
+def _scale_str(value: Any, decimals: int) -> int:
+    """
+    Converts a decimal value to an integer scaled by 10**decimals,
+        truncating extra fractional digits.
+
+    Plain decimal strings are scaled by shifting the decimal point, which skips
+    the Decimal machinery; anything else (Decimal inputs, scientific notation)
+    falls back to the equivalent int(Decimal(value) * Decimal(10**decimals)).
+    """
+    if isinstance(value, str) and not any(c in value for c in "eE_"):
+        int_part, _, frac_part = value.partition(".")
+        # Digit-less strings ("", ".", "-") would int() to 0 here; let the
+        # Decimal fallback raise InvalidOperation for them instead.
+        if int_part.lstrip("+-") or frac_part:
+            try:
+                return int(int_part + frac_part[:decimals].ljust(decimals, "0"))
+            except ValueError:
+                pass
+    return int(Decimal(value) * _DEC_POW10[decimals])
+
 # Custom types
 EIP712_ORDER_MESSAGE_TYPE = {
     "Order": [
@@ -328,37 +537,44 @@ class GrvtOrder:
     reduce_only: bool = False
 
 
+@functools.lru_cache(maxsize=8)
+def _account_from_key(private_key: str) -> Account:
+    """
+    Returns the eth Account for `private_key`, cached across calls.
+    Deriving the address from the key is a secp256k1 point multiplication (~1ms),
+    so repeated signs with the same key should not pay it every time.
+    """
+    return Account.from_key(private_key)
+
+
 def get_signable_message(
     order: GrvtOrder, env: GrvtEnv, instruments: dict[str, dict]
 ) -> bytes | None:
-    FN = f"get_signable_message {order=}"
-    size_multiplier = BTC_ETH_SIZE_MULTIPLIER
-    PRICE_MULTIPLIER = 1_000_000_000
+    FN = "get_signable_message"
     legs = []
     for leg in order.legs:
         instrument = instruments.get(leg.instrument)
         if not instrument or not isinstance(instrument, dict):
-            logging.error(f"{FN}: {leg.instrument=} not found in {instruments=}")
+            logging.error(f"{FN} {order=}: {leg.instrument=} not found in {instruments=}")
             return None
         if "base_decimals" not in instrument:
-            logging.error(f"{FN}: no 'base_decimals' in {instrument=}")
+            logging.error(f"{FN} {order=}: no 'base_decimals' in {instrument=}")
             return None
-        size_multiplier = 10 ** instrument["base_decimals"]
         if "instrument_hash" not in instrument:
-            logging.error(f"{FN}: no 'instrument_hash' in {instrument=}")
+            logging.error(f"{FN} {order=}: no 'instrument_hash' in {instrument=}")
             return None
         legs.append(
             {
                 "assetID": instrument["instrument_hash"],
-                "contractSize": int(Decimal(leg.size) * Decimal(size_multiplier)),
-                "limitPrice": int(Decimal(leg.limit_price) * Decimal(PRICE_MULTIPLIER)),
+                "contractSize": _scale_str(leg.size, instrument["base_decimals"]),
+                "limitPrice": _scale_str(leg.limit_price, 9),
                 "isBuyingContract": leg.is_buying_asset,
             }
         )
     message_data = {
         "subAccountID": order.sub_account_id,
         "isMarket": order.is_market or False,
-        "timeInForce": TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE[order.time_in_force].value,
+        "timeInForce": _TIF_TO_SIGN_TIF_VALUE[order.time_in_force],
         "postOnly": order.post_only or False,
         "reduceOnly": order.reduce_only or False,
         "legs": legs,
@@ -366,7 +582,12 @@ def get_signable_message(
         "expiration": order.signature.expiration,
     }
     domain_data: dict[str, str | int]= get_EIP712_domain_data(env)
-    logging.info(f"{FN} {domain_data=}\n{EIP712_ORDER_MESSAGE_TYPE=}\n{message_data=}")
+    # Only build the (large) debug repr when INFO logging is actually enabled -
+    # this sits on the per-order signing path.
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info(
+            f"{FN} {order=} {domain_data=}\n{EIP712_ORDER_MESSAGE_TYPE=}\n{message_data=}"
+        )
     return encode_typed_data(domain_data, EIP712_ORDER_MESSAGE_TYPE, message_data)
 
 
@@ -376,11 +597,15 @@ def get_order_payload(
     signable_message = get_signable_message(order, env, instruments)
     if signable_message is None:
         raise ValueError("Failed to create signable message")
-    signed_message = Account.sign_message(signable_message, private_key)
-    order.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    order.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    order.signature.v = signed_message.v
-    order.signature.signer = Account.from_key(private_key).address
+    account = _account_from_key(private_key)
+    # r and s are sliced straight out of the 65-byte signature rather than
+    # round-tripping through Python ints.
+    sig = bytes(account.sign_message(signable_message).signature)
+    signature = order.signature
+    signature.s = s_hex = "0x" + sig[32:64].hex()
+    signature.r = r_hex = "0x" + sig[:32].hex()
+    signature.v = v = sig[64]
+    signature.signer = account.address
 
     return {
         "order": {
@@ -399,12 +624,12 @@ def get_order_payload(
                 for leg in order.legs
             ],
             "signature": {
-                "r": order.signature.r,
-                "s": order.signature.s,
-                "v": order.signature.v,
-                "expiration": order.signature.expiration,
-                "nonce": order.signature.nonce,
-                "signer": order.signature.signer,
+                "r": r_hex,
+                "s": s_hex,
+                "v": v,
+                "expiration": signature.expiration,
+                "nonce": signature.nonce,
+                "signer": account.address,
             },
             "metadata": {
                 "client_order_id": order.metadata.client_order_id,
@@ -531,14 +756,16 @@ def sign_derisk_mm_ratio_request(
     }
 
     message = encode_typed_data(domain_data, types, signature_payload)
-    signed = Account.sign_message(message, private_key_hex)
-    signer = Account.from_key(private_key_hex)
+    signer = _account_from_key(private_key_hex)
+    signed = signer.sign_message(message)
+    # Single tuple-unpack: .r/.s/.v are properties, so read each just once
+    r, s, v = signed.r, signed.s, signed.v
 
     return {
         "signer": signer.address.lower(),
-        "r": hex(signed.r),
-        "s": hex(signed.s),
-        "v": signed.v,
+        "r": hex(r),
+        "s": hex(s),
+        "v": v,
         "expiration": str(expiration_ns),
         "nonce": nonce,
     }
\ No newline at end of file
@@ -1,11 +1,22 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from enum import Enum
 from decimal import Decimal
+from functools import lru_cache
 from typing import Any, Optional
 
+from eth_abi import encode as abi_encode
 from eth_account import Account
-from eth_account.messages import encode_typed_data
+from eth_account._utils.encode_typed_data import hash_eip712_message
+from eth_utils.crypto import keccak
 
-from .grvt_ccxt_utils import GrvtCurrency
+try:
+    import coincurve
+except ImportError:
+    coincurve = None  # type: ignore[assignment]
+
+from .grvt_ccxt_utils import GrvtCurrency, _scale_str
 from .grvt_raw_base import GrvtApiConfig, GrvtEnv
 from .grvt_raw_types import Instrument, Order, Withdrawal, TimeInForce
 from .grvt_fixed_types import Transfer
@@ -32,6 +43,12 @@ TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE = {
     TimeInForce.FILL_OR_KILL: SignTimeInForce.FILL_OR_KILL,
 }
 
+# Flattened TimeInForce -> int mapping for the signing hot path: one dict
+# lookup instead of an Enum lookup chain plus a .value attribute access.
+_TIF_TO_SIGN_TIF_VALUE = {
+    tif: sign_tif.value for tif, sign_tif in TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE.items()
+}
+
 
 #####################
 # EIP-712 chain IDs #
@@ -52,6 +69,25 @@ def get_EIP712_domain_data(env: GrvtEnv, chainId: int | None) -> dict[str, str |
     }
 
 
+# hashStruct(EIP712Domain) inputs are fixed per environment, so the separator is
+# memoized instead of being rehashed (3 keccak calls) on every sign.
+_DOMAIN_TYPE_HASH = keccak(b"EIP712Domain(string name,string version,uint256 chainId)")
+_DOMAIN_NAME_HASH = keccak(b"GRVT Exchange")
+_DOMAIN_VERSION_HASH = keccak(b"0")
+
+
+@lru_cache(maxsize=8)
+def _domain_separator(env: GrvtEnv, chain_id: int | None = None) -> bytes:
+    """Returns the 32-byte EIP-712 domain separator for `env` / `chain_id`."""
+    chain = chain_id or CHAIN_IDS[env]
+    return keccak(
+        _DOMAIN_TYPE_HASH
+        + _DOMAIN_NAME_HASH
+        + _DOMAIN_VERSION_HASH
+        + chain.to_bytes(32, byteorder="big")
+    )
+
+
 #####################
 # Sign Order #
 #####################
@@ -76,6 +112,214 @@ EIP712_ORDER_MESSAGE_TYPE = {
 }
 
 
+def _eip712_type_str(name: str, types: dict[str, list[dict[str, str]]]) -> str:
+    """Returns the canonical EIP-712 encoding of a single struct type."""
+    fields = ",".join(f"{field['type']} {field['name']}" for field in types[name])
+    return f"{name}({fields})"
+
+
+# typeHash(Order) and typeHash(OrderLeg) are constant, so they are computed once
+# at import instead of being re-derived from the type dict on every sign.
+_ORDER_TYPE_HASH = keccak(
+    (
+        _eip712_type_str("Order", EIP712_ORDER_MESSAGE_TYPE)
+        + _eip712_type_str("OrderLeg", EIP712_ORDER_MESSAGE_TYPE)
+    ).encode()
+)
+_ORDER_LEG_TYPE_HASH = keccak(
+    _eip712_type_str("OrderLeg", EIP712_ORDER_MESSAGE_TYPE).encode()
+)
+
+
+_LEG_ABI_TYPES = ["bytes32", "uint256", "uint64", "uint64", "bool"]
+_ORDER_ABI_TYPES = [
+    "bytes32",
+    "uint64",
+    "bool",
+    "uint8",
+    "bool",
+    "bool",
+    "bytes32",
+    "uint32",
+    "int64",
+]
+
+
+@dataclass(slots=True)
+class _Leg:
+    """
+    Scaled order leg used while hashing.
+    With slots these are ~4x smaller than the equivalent per-leg dicts,
+        which matters for multi-leg orders signed in a loop.
+    """
+
+    asset_id: int
+    contract_size: int
+    limit_price: int
+    is_buying_contract: bool
+
+
+@lru_cache(maxsize=1024)
+def _asset_id_from_hash(instrument_hash: str) -> int:
+    """
+    Hex-parses an instrument hash once per instrument.
+    Batch signing otherwise re-parses the same few hashes for every order.
+    """
+    return int(instrument_hash, 16)
+
+
+def _scaled_legs(order: Order, instruments: dict[str, Instrument]) -> list[_Leg]:
+    """Resolves each leg's asset ID and scales its size/price for hashing."""
+    legs = []
+    for leg in order.legs:
+        instrument = instruments[leg.instrument]
+        legs.append(
+            _Leg(
+                asset_id=_asset_id_from_hash(instrument.instrument_hash),
+                contract_size=_scale_str(leg.size, instrument.base_decimals),
+                limit_price=_scale_str(leg.limit_price, 9),
+                is_buying_contract=leg.is_buying_asset,
+            )
+        )
+    return legs
+
+
+def _hash_order(
+    sub_account_id: int,
+    is_market: bool,
+    time_in_force: int,
+    post_only: bool,
+    reduce_only: bool,
+    legs: list[_Leg],
+    nonce: int,
+    expiration: int,
+) -> bytes:
+    """Returns hashStruct(Order) per EIP-712 using the precomputed type hashes."""
+    legs_hash = keccak(
+        b"".join(
+            keccak(
+                abi_encode(
+                    _LEG_ABI_TYPES,
+                    [
+                        _ORDER_LEG_TYPE_HASH,
+                        leg.asset_id,
+                        leg.contract_size,
+                        leg.limit_price,
+                        leg.is_buying_contract,
+                    ],
+                )
+            )
+            for leg in legs
+        )
+    )
+    return keccak(
+        abi_encode(
+            _ORDER_ABI_TYPES,
+            [
+                _ORDER_TYPE_HASH,
+                sub_account_id,
+                is_market,
+                time_in_force,
+                post_only,
+                reduce_only,
+                legs_hash,
+                nonce,
+                expiration,
+            ],
+        )
+    )
+
+
+def _hash_order_message(message_data: dict[str, Any]) -> bytes:
+    """
+    Dict-based counterpart of _hash_order, equivalent to
+        hash_eip712_message(EIP712_ORDER_MESSAGE_TYPE, message_data).
+    """
+    legs = [
+        _Leg(
+            asset_id=int(leg["assetID"], 16)
+            if isinstance(leg["assetID"], str)
+            else int(leg["assetID"]),
+            contract_size=int(leg["contractSize"]),
+            limit_price=int(leg["limitPrice"]),
+            is_buying_contract=bool(leg["isBuyingContract"]),
+        )
+        for leg in message_data["legs"]
+    ]
+    return _hash_order(
+        int(message_data["subAccountID"]),
+        bool(message_data["isMarket"]),
+        int(message_data["timeInForce"]),
+        bool(message_data["postOnly"]),
+        bool(message_data["reduceOnly"]),
+        legs,
+        int(message_data["nonce"]),
+        int(message_data["expiration"]),
+    )
+
+
+def _eip712_digest(domain_separator: bytes, message_hash: bytes) -> bytes:
+    """
+    Returns the 32-byte EIP-191 digest for a domain separator
+        and a hashStruct(message).
+    """
+    return keccak(b"\x19\x01" + domain_separator + message_hash)
+
+
+def _sign_digest(digest: bytes, account: Account) -> tuple[bytes, bytes, int]:
+    """
+    Signs a 32-byte digest with `account`'s key and returns (r, s, v)
+        with r and s as 32-byte big-endian values.
+
+    Uses libsecp256k1 via coincurve when it is installed (~10-20x faster than
+    the pure-Python backend), falling back to eth-account otherwise. Both
+    produce identical RFC-6979 deterministic signatures. r and s are sliced
+    straight out of the 65-byte signature rather than round-tripping through
+    Python ints.
+    """
+    if coincurve is not None:
+        sig = coincurve.PrivateKey(bytes(account.key)).sign_recoverable(
+            digest, hasher=None
+        )
+        return sig[:32], sig[32:64], sig[64] + 27
+    sig = bytes(account.unsafe_sign_hash(digest).signature)
+    return sig[:32], sig[32:64], sig[64]
+
+
+def _sign_one(
+    order: Order,
+    domain_separator: bytes,
+    account: Account,
+    signer: str,
+    instruments: dict[str, Instrument],
+) -> Order:
+    """Signs a single order in place, with the per-batch setup already done."""
+    # Hash straight from the order and _Leg objects: the dict message built by
+    # build_EIP712_order_message_data is only needed by callers that want to
+    # inspect the signed payload.
+    digest = _eip712_digest(
+        domain_separator,
+        _hash_order(
+            int(order.sub_account_id),
+            order.is_market or False,
+            _TIF_TO_SIGN_TIF_VALUE[order.time_in_force],
+            order.post_only or False,
+            order.reduce_only or False,
+            _scaled_legs(order, instruments),
+            int(order.signature.nonce),
+            int(order.signature.expiration),
+        ),
+    )
+    r, s, v = _sign_digest(digest, account)
+
+    order.signature.s = "0x" + s.hex()
+    order.signature.r = "0x" + r.hex()
+    order.signature.v = v
+    order.signature.signer = signer
+
+    return order
+
+
 def sign_order(
     order: Order,
     config: GrvtApiConfig,
@@ -85,20 +329,74 @@ def sign_order(
     if config.private_key is None:
         raise ValueError("Private key is not set")
 
-    message_data = build_EIP712_order_message_data(order, instruments)
+    return _sign_one(
+        order,
+        _domain_separator(config.env, CHAIN_IDS[config.env]),
+        account,
+        str(account.address),
+        instruments,
+    )
+
+
+# Signing is CPU-bound and each order is independent, so large batches can be
+# distributed over cores. Below this size the pool startup cost dominates the
+# few hundred microseconds each signature takes.
+_PARALLEL_SIGN_MIN_ORDERS = 512
 
-    domain_data = get_EIP712_domain_data(config.env, CHAIN_IDS[config.env])
-    signable_message = encode_typed_data(
-        domain_data, EIP712_ORDER_MESSAGE_TYPE, message_data
+# Per-worker signing context, populated once by the pool initializer so workers
+# derive the account a single time instead of per order.
+_sign_worker_ctx: dict[str, Any] = {}
+
+
+def _init_sign_worker(
+    private_key: str, domain_separator: bytes, instruments: dict[str, Instrument]
+) -> None:
+    account = Account.from_key(private_key)
+    _sign_worker_ctx["account"] = account
+    _sign_worker_ctx["signer"] = str(account.address)
+    _sign_worker_ctx["domain_separator"] = domain_separator
+    _sign_worker_ctx["instruments"] = instruments
+
+
+def _sign_one_in_worker(order: Order) -> Order:
+    ctx = _sign_worker_ctx
+    return _sign_one(
+        order, ctx["domain_separator"], ctx["account"], ctx["signer"], ctx["instruments"]
     )
-    signed_message = account.sign_message(signable_message)
 
-    order.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    order.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    order.signature.v = signed_message.v
-    order.signature.signer = str(account.address)
 
-    return order
+def sign_orders(
+    orders: list[Order],
+    config: GrvtApiConfig,
+    account: Account,
+    instruments: dict[str, Instrument],
+    max_workers: int | None = None,
+) -> list[Order]:
+    """
+    Signs a batch of orders and returns them.
+
+    The domain separator and signer address are resolved once for the whole
+    batch, so each order only pays for its own struct hash and ECDSA signature.
+    Batches of _PARALLEL_SIGN_MIN_ORDERS or more are signed on a process pool
+    (signing is CPU-bound); the returned orders are then copies rather than the
+    input objects signed in place.
+    """
+    if config.private_key is None:
+        raise ValueError("Private key is not set")
+
+    domain_separator = _domain_separator(config.env, CHAIN_IDS[config.env])
+    if len(orders) >= _PARALLEL_SIGN_MIN_ORDERS and (os.cpu_count() or 1) > 1:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_sign_worker,
+            initargs=(str(config.private_key), domain_separator, instruments),
+        ) as executor:
+            return list(executor.map(_sign_one_in_worker, orders, chunksize=16))
+    signer = str(account.address)
+    return [
+        _sign_one(order, domain_separator, account, signer, instruments)
+        for order in orders
+    ]
 
 
 def build_EIP712_order_message_data(
@@ -107,13 +405,13 @@ def build_EIP712_order_message_data(
     legs = []
     for leg in order.legs:
         instrument = instruments[leg.instrument]
-        size_multiplier = 10**instrument.base_decimals
 
-        # use Decimal() instead of float() to avoid precision loss
+        # _scale_str shifts the decimal point on the string (or falls back to
+        # Decimal) instead of going through float, to avoid precision loss:
         # int(float("1.013") * 1e9) = 1012999999
         # int(Decimal("1.013") * Decimal(1e9) = 1013000000
-        size_int = int(Decimal(leg.size) * Decimal(size_multiplier))
-        price_int = int(Decimal(leg.limit_price) * Decimal(PRICE_MULTIPLIER))
+        size_int = _scale_str(leg.size, instrument.base_decimals)
+        price_int = _scale_str(leg.limit_price, 9)
         legs.append(
             {
                 "assetID": instrument.instrument_hash,
@@ -125,7 +423,7 @@ def build_EIP712_order_message_data(
     return {
         "subAccountID": order.sub_account_id,
         "isMarket": order.is_market or False,
-        "timeInForce": TIME_IN_FORCE_TO_SIGN_TIME_IN_FORCE[order.time_in_force].value,
+        "timeInForce": _TIF_TO_SIGN_TIF_VALUE[order.time_in_force],
         "postOnly": order.post_only or False,
         "reduceOnly": order.reduce_only or False,
         "legs": legs,
@@ -177,17 +475,16 @@ def sign_transfer(
     if config.private_key is None:
         raise ValueError("Private key is not set")
 
-    domain = get_EIP712_domain_data(config.env, chainId)
-
     message_data = build_EIP712_transfer_message_data(transfer, currencyId)
-    signable_message = encode_typed_data(
-        domain, EIP712_TRANSFER_MESSAGE_TYPE, message_data
+    digest = _eip712_digest(
+        _domain_separator(config.env, chainId),
+        hash_eip712_message(EIP712_TRANSFER_MESSAGE_TYPE, message_data),
     )
-    signed_message = account.sign_message(signable_message)
+    r, s, v = _sign_digest(digest, account)
 
-    transfer.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    transfer.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    transfer.signature.v = signed_message.v
+    transfer.signature.r = "0x" + r.hex()
+    transfer.signature.s = "0x" + s.hex()
+    transfer.signature.v = v
     transfer.signature.signer = str(account.address)
 
     return transfer
@@ -232,17 +529,16 @@ def sign_withdrawal(
     if config.private_key is None:
         raise ValueError("Private key is not set")
 
-    domain = get_EIP712_domain_data(config.env, chainId)
-
     message_data = build_EIP712_withdrawal_message_data(withdrawal, currencyId)
-    signable_message = encode_typed_data(
-        domain, EIP712_WITHDRAWAL_MESSAGE_TYPE, message_data
+    digest = _eip712_digest(
+        _domain_separator(config.env, chainId),
+        hash_eip712_message(EIP712_WITHDRAWAL_MESSAGE_TYPE, message_data),
     )
-    signed_message = account.sign_message(signable_message)
+    r, s, v = _sign_digest(digest, account)
 
-    withdrawal.signature.r = "0x" + signed_message.r.to_bytes(32, byteorder="big").hex()
-    withdrawal.signature.s = "0x" + signed_message.s.to_bytes(32, byteorder="big").hex()
-    withdrawal.signature.v = signed_message.v
+    withdrawal.signature.r = "0x" + r.hex()
+    withdrawal.signature.s = "0x" + s.hex()
+    withdrawal.signature.v = v
     withdrawal.signature.signer = str(account.address)
 
     return withdrawal
@@ -0,0 +1,136 @@
+# ruff: noqa: T201
+"""
+Demo CLI: signs a sample order and prints the signature.
+
+Run via `make run` (or `python -m pysdk.main`). By default only the signer
+address and r/s/v are printed; pass --verbose to also pretty-print the
+EIP-712 message data and the signed order payload.
+"""
+
+import argparse
+import dataclasses
+import json
+import logging
+import os
+import random
+import time
+from typing import Any
+
+from eth_account import Account
+
+from pysdk.grvt_raw_base import GrvtApiConfig
+from pysdk.grvt_raw_env import GrvtEnv
+from pysdk.grvt_raw_signing import build_EIP712_order_message_data, sign_order
+from pysdk.grvt_raw_types import (
+    Instrument,
+    InstrumentSettlementPeriod,
+    Kind,
+    Order,
+    OrderLeg,
+    OrderMetadata,
+    Signature,
+    TimeInForce,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Throwaway demo key: never fund or reuse this account.
+DEMO_PRIVATE_KEY = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+DEMO_SUB_ACCOUNT_ID = "8289849667772468"
+
+DEMO_INSTRUMENTS = {
+    "BTC_USDT_Perp": Instrument(
+        instrument="BTC_USDT_Perp",
+        instrument_hash="0x030501",
+        base="BTC",
+        quote="USDT",
+        kind=Kind.PERPETUAL,
+        venues=[],
+        settlement_period=InstrumentSettlementPeriod.DAILY,
+        tick_size="0.00000001",
+        min_size="0.00000001",
+        create_time="123",
+        base_decimals=9,
+        quote_decimals=9,
+        max_position_size="1000000",
+    )
+}
+
+
+def _pretty_json(obj: Any) -> str:
+    """Pretty-prints `obj` as JSON, via orjson when available. Enums become strings."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=str)
+
+
+def _demo_order() -> Order:
+    create_time_ns = time.time_ns()
+    return Order(
+        metadata=OrderMetadata(client_order_id="1", create_time=str(create_time_ns)),
+        sub_account_id=DEMO_SUB_ACCOUNT_ID,
+        time_in_force=TimeInForce.GOOD_TILL_TIME,
+        post_only=False,
+        is_market=False,
+        reduce_only=False,
+        legs=[
+            OrderLeg(
+                instrument="BTC_USDT_Perp",
+                size="1.013",
+                limit_price="68900.5",
+                is_buying_asset=False,
+            )
+        ],
+        signature=Signature(
+            signer="",
+            r="",
+            s="",
+            v=0,
+            expiration=create_time_ns + 86_400 * 1_000_000_000,
+            nonce=random.randint(1, 2**32 - 1),
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m pysdk.main", description=__doc__.strip().splitlines()[0]
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="store_true",
+        help="also pretty-print the EIP-712 message data and signed order",
+    )
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=os.getenv("GRVT_PRIVATE_KEY", DEMO_PRIVATE_KEY),
+        trading_account_id=DEMO_SUB_ACCOUNT_ID,
+        api_key=None,
+        logger=logging.getLogger(__name__),
+    )
+    account = Account.from_key(config.private_key)
+    order = _demo_order()
+    signed_order = sign_order(order, config, account, DEMO_INSTRUMENTS)
+
+    signature = signed_order.signature
+    print(f"signer={signature.signer}")
+    print(f"r={signature.r}")
+    print(f"s={signature.s}")
+    print(f"v={signature.v}")
+    if args.verbose:
+        message_data = build_EIP712_order_message_data(signed_order, DEMO_INSTRUMENTS)
+        print("EIP-712 message data:")
+        print(_pretty_json(message_data))
+        print("Signed order:")
+        print(_pretty_json(dataclasses.asdict(signed_order)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import asyncio
+from decimal import Decimal, InvalidOperation
+
+import pytest
+
+import pysdk.grvt_ccxt_utils
+from pysdk.grvt_ccxt_env import GrvtEnv
+from pysdk.grvt_ccxt_utils import (
+    _load_cached_instruments,
+    _save_cached_instruments,
+    _scale_str,
+    fetch_instruments_all_envs,
+)
+
+
+def test_instruments_cache_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        pysdk.grvt_ccxt_utils, "_INSTRUMENTS_CACHE_DIR", str(tmp_path)
+    )
+    instruments = {
+        "BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9}
+    }
+    _save_cached_instruments(GrvtEnv.TESTNET, "https://example/instruments", instruments)
+    assert _load_cached_instruments(GrvtEnv.TESTNET) == instruments
+    # A stale cache file is treated as a miss
+    assert _load_cached_instruments(GrvtEnv.TESTNET, ttl=0) is None
+    # Envs do not share cache files
+    assert _load_cached_instruments(GrvtEnv.DEV) is None
+
+
+def test_fetch_instruments_all_envs_uses_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        pysdk.grvt_ccxt_utils, "_INSTRUMENTS_CACHE_DIR", str(tmp_path)
+    )
+    monkeypatch.setattr(pysdk.grvt_ccxt_utils, "_instruments_memo", {})
+    instruments = {
+        "BTC_USDT_Perp": {"instrument_hash": "0x030501", "base_decimals": 9}
+    }
+    _save_cached_instruments(GrvtEnv.TESTNET, "https://example/instruments", instruments)
+    # A warm cache means no socket is opened, so this works offline
+    result = asyncio.run(fetch_instruments_all_envs([GrvtEnv.TESTNET]))
+    assert result == {GrvtEnv.TESTNET.value: instruments}
+
+
+def test_scale_str_matches_decimal_path():
+    cases = [
+        ("1.013", 9),
+        ("1.123123123", 9),
+        # extra fractional digits are truncated, not rounded
+        ("1.1231231239", 9),
+        ("68900.7771234794", 9),
+        ("-1.0135", 3),
+        ("0.000000001", 9),
+        ("5", 9),
+        ("64170.7", 9),
+        # scientific notation and Decimal inputs take the fallback path
+        ("1e2", 9),
+        (Decimal("1.013"), 9),
+    ]
+    for value, decimals in cases:
+        assert _scale_str(value, decimals) == int(
+            Decimal(value) * Decimal(10**decimals)
+        ), f"mismatch for {value=} {decimals=}"
+    # Digit-less strings raise like the baseline Decimal path did
+    for value in ("", ".", "-", "+", "-."):
+        with pytest.raises(InvalidOperation):
+            _scale_str(value, 9)
@@ -7,7 +7,7 @@ from eth_account import Account
 from pysdk.grvt_fixed_types import Transfer
 from pysdk.grvt_raw_base import GrvtApiConfig
 from pysdk.grvt_raw_env import GrvtEnv
-from pysdk.grvt_raw_signing import sign_order, sign_transfer
+from pysdk.grvt_raw_signing import sign_order, sign_orders, sign_transfer
 from pysdk.grvt_raw_types import (
     Instrument,
     InstrumentSettlementPeriod,
@@ -384,10 +384,131 @@ def test_sign_transfer_table():
             ), f"Test '{tc['name']}' failed: v value mismatch"
 
 
+def test_sign_orders_matches_sign_order():
+    import copy
+
+    private_key = "f7934647276a6e1fa0af3f4467b4b8ddaf45d25a7368fa1a295eef49a446819d"
+    sub_account_id = "8289849667772468"
+    account = Account.from_key(private_key)
+    config = GrvtApiConfig(
+        env=GrvtEnv.TESTNET,
+        private_key=private_key,
+        trading_account_id=sub_account_id,
+        api_key="not-needed",
+        logger=logger,
+    )
+    instruments = {
+        "BTC_USDT_Perp": Instrument(
+            instrument="BTC_USDT_Perp",
+            instrument_hash="0x030501",
+            base="BTC",
+            quote="USDT",
+            kind=Kind.PERPETUAL,
+            venues=[],
+            settlement_period=InstrumentSettlementPeriod.DAILY,
+            tick_size="0.00000001",
+            min_size="0.00000001",
+            create_time="123",
+            base_decimals=9,
+            quote_decimals=9,
+            max_position_size="1000000",
+        )
+    }
+    orders = [
+        Order(
+            metadata=OrderMetadata(
+                client_order_id=str(i), create_time="1730800479321350000"
+            ),
+            sub_account_id=sub_account_id,
+            time_in_force=TimeInForce.GOOD_TILL_TIME,
+            post_only=False,
+            is_market=False,
+            reduce_only=False,
+            legs=[
+                OrderLeg(
+                    instrument="BTC_USDT_Perp",
+                    size=f"1.01{i}",
+                    limit_price="68900.5",
+                    is_buying_asset=False,
+                )
+            ],
+            signature=Signature(
+                signer="",
+                r="",
+                s="",
+                v=0,
+                expiration=1730800479321350000,
+                nonce=828700936 + i,
+            ),
+        )
+        for i in range(3)
+    ]
+
+    batch_signed = sign_orders(copy.deepcopy(orders), config, account, instruments)
+    for order, batch_order in zip(orders, batch_signed):
+        single = sign_order(copy.deepcopy(order), config, account, instruments)
+        assert batch_order.signature.r == single.signature.r
+        assert batch_order.signature.s == single.signature.s
+        assert batch_order.signature.v == single.signature.v
+        assert batch_order.signature.signer == str(account.address)
+
+    # The process-pool path must produce identical signatures
+    import pysdk.grvt_raw_signing as signing
+
+    old_threshold = signing._PARALLEL_SIGN_MIN_ORDERS
+    signing._PARALLEL_SIGN_MIN_ORDERS = 2
+    try:
+        parallel_signed = sign_orders(
+            copy.deepcopy(orders), config, account, instruments, max_workers=2
+        )
+    finally:
+        signing._PARALLEL_SIGN_MIN_ORDERS = old_threshold
+    for batch_order, parallel_order in zip(batch_signed, parallel_signed):
+        assert parallel_order.signature.r == batch_order.signature.r
+        assert parallel_order.signature.s == batch_order.signature.s
+        assert parallel_order.signature.v == batch_order.signature.v
+        assert parallel_order.signature.signer == str(account.address)
+
+
+def test_hash_order_message_matches_eth_account():
+    from eth_account._utils.encode_typed_data import hash_eip712_message
+
+    from pysdk.grvt_raw_signing import EIP712_ORDER_MESSAGE_TYPE, _hash_order_message
+
+    message_data = {
+        "subAccountID": "8289849667772468",
+        "isMarket": False,
+        "timeInForce": 1,
+        "postOnly": True,
+        "reduceOnly": False,
+        "legs": [
+            {
+                "assetID": "0x030501",
+                "contractSize": 1013000000,
+                "limitPrice": 68900500000000,
+                "isBuyingContract": False,
+            },
+            {
+                "assetID": "0x030502",
+                "contractSize": 25000000000,
+                "limitPrice": 3000100000000,
+                "isBuyingContract": True,
+            },
+        ],
+        "nonce": 828700936,
+        "expiration": 1730800479321350000,
+    }
+    assert (
+        _hash_order_message(message_data)
+        == hash_eip712_message(EIP712_ORDER_MESSAGE_TYPE, message_data)
+    )
+
+
 def main():
     functions = [
         test_sign_order_table,
         test_sign_transfer_table,
+        test_hash_order_message_matches_eth_account,
     ]
     for f in functions:
         try: